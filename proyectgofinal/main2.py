@@ -1,49 +1,62 @@
+import re
 import sys
-from typing import List
-from tabulate import tabulate
-
-class Proceso:
-    def __init__(self, id_proceso: str, tiempo_llegada: int, tiempo_ejecucion: int):
-        self.id = id_proceso
-        self.ti = tiempo_llegada      # Tiempo de llegada
-        self.t = tiempo_ejecucion     # Tiempo de ejecución
-        self.tf = 0                   # Tiempo de finalización
-        self.T = 0                    # Tiempo de retorno (T = tf - ti)
-        self.E = 0                    # Tiempo de espera (E = T - t)
-        self.I = 0.0                  # Índice de penalización (I = t/T)
-        self.tiempo_restante = tiempo_ejecucion  # Para Round Robin
-
-def cargar_procesos(archivo: str = "datos.txt") -> List[Proceso]:
+from pathlib import Path
+from typing import Dict, Optional
+
+import numpy as np
+
+try:
+    from numba import njit
+    HAY_NUMBA = True
+except ImportError:  # Sin numba los núcleos se ejecutan en Python puro
+    HAY_NUMBA = False
+    def njit(*args, **kwargs):
+        if args and callable(args[0]):
+            return args[0]
+        return lambda funcion: funcion
+
+# Los procesos se representan como estructura de arreglos (SoA):
+# un diccionario con arreglos paralelos 'id', 'ti' (llegada) y 't' (ejecución).
+# Los algoritmos no lo modifican; devuelven un arreglo estructurado con los
+# campos (id, ti, t, tf, T, E, I) en un único bloque contiguo.
+Procesos = Dict[str, np.ndarray]
+Resultados = np.ndarray
+
+# Tabla de resultados: 7 columnas centradas; cada columna se ensancha
+# según su celda más larga a partir de estos anchos mínimos
+_COLUMNAS = ("Proceso", "ti", "t", "tf", "T", "E", "I")
+_ANCHOS_MIN = (8, 4, 4, 4, 4, 4, 8)
+
+# Línea válida: id seguido de dos enteros, separados por paréntesis,
+# comas o espacios. Cubre los formatos A (2, 1) | A,2,1 | A 2 1
+LINE_RE = re.compile(r'^([^\s,()]+)[\s,()]+(\d+)[\s,()]+(\d+)[\s)]*$')
+
+def cargar_procesos(archivo: str = "datos.txt") -> Procesos:
     """
     Carga procesos desde archivo .txt con formatos:
     - A (2, 1)
     - B,6,6
     - C 5 3
     """
-    procesos = []
+    ids, llegadas, ejecuciones = [], [], []
     try:
-        with open(archivo, 'r') as file:
-            for linea in file:
-                linea = linea.strip()
-                if not linea or linea.startswith('#'):
-                    continue
-                
-                # Manejar múltiples formatos
-                if '(' in linea:  # Formato: A (2, 1)
-                    partes = linea.replace('(', ' ').replace(')', ' ').replace(',', ' ').split()
-                elif ',' in linea:  # Formato: A,2,1
-                    partes = linea.split(',')
-                else:  # Formato: A 2 1
-                    partes = linea.split()
-                
-                if len(partes) == 3:
-                    try:
-                        id_proc = partes[0].strip()
-                        ti = int(partes[1])
-                        t = int(partes[2])
-                        procesos.append(Proceso(id_proc, ti, t))
-                    except ValueError:
-                        print(f"¡Advertencia! Formato incorrecto en línea: {linea}")
+        # Lectura completa del archivo en una sola operación
+        texto = Path(archivo).read_text(encoding='utf-8')
+        lineas = [linea.strip() for linea in texto.splitlines()]
+        
+        for linea in lineas:
+            if not linea or linea.startswith('#'):
+                continue
+            
+            # La línea se valida antes de convertir, sin excepciones
+            m = LINE_RE.match(linea)
+            if m is None:
+                print(f"¡Advertencia! Formato incorrecto en línea: {linea}")
+                continue
+            
+            ids.append(m[1])
+            llegadas.append(int(m[2]))
+            ejecuciones.append(int(m[3]))
     
     except FileNotFoundError:
         print(f"\nERROR: No se encontró el archivo '{archivo}'")
@@ -57,151 +70,233 @@ def cargar_procesos(archivo: str = "datos.txt") -> List[Proceso]:
         print(f"\nERROR inesperado: {e}")
         sys.exit(1)
     
-    if not procesos:
+    if not ids:
         print("\nERROR: El archivo no contiene datos válidos")
         print("Formato esperado (3 variantes aceptadas):")
         print("A (2, 1)  |  A,2,1  |  A 2 1")
         sys.exit(1)
         
-    print(f"\n✓ Se cargaron {len(procesos)} procesos desde '{archivo}'")
-    return procesos
+    print(f"\n✓ Se cargaron {len(ids)} procesos desde '{archivo}'")
+    return {
+        'id': np.array(ids),
+        'ti': np.fromiter(llegadas, np.int64, count=len(llegadas)),
+        't': np.fromiter(ejecuciones, np.int64, count=len(ejecuciones)),
+    }
 
-def mostrar_resultados(titulo: str, procesos: List[Proceso]):
+def mostrar_resultados(titulo: str, resultados: Resultados):
     """Muestra resultados en formato de tabla con promedios"""
+    ids = resultados['id']
+    ti, t, tf = resultados['ti'], resultados['t'], resultados['tf']
+    T, E, I = resultados['T'], resultados['E'], resultados['I']
+
     tabla = []
-    for proc in sorted(procesos, key=lambda x: x.id):
+    for i in np.argsort(ids, kind='stable'):
         tabla.append([
-            proc.id,
-            proc.ti,
-            proc.t,
-            proc.tf,
-            proc.T,
-            proc.E,
-            f"{proc.I:.4f}" if proc.T != 0 else "N/A"
+            str(ids[i]),
+            str(ti[i]),
+            str(t[i]),
+            str(tf[i]),
+            str(T[i]),
+            str(E[i]),
+            f"{I[i]:.4f}" if T[i] != 0 else "N/A"
         ])
     
-    # Calcular promedios excluyendo divisiones por cero
-    tiempos_T = [p.T for p in procesos]
-    tiempos_E = [p.E for p in procesos]
-    indices_I = [p.I for p in procesos if p.T != 0]
+    # Anchos de columna según el contenido de esta tabla
+    anchos = [
+        max([minimo, len(columna)] + [len(fila[k]) for fila in tabla])
+        for k, (columna, minimo) in enumerate(zip(_COLUMNAS, _ANCHOS_MIN))
+    ]
+    formato = "| " + " | ".join(f"{{:^{ancho}}}" for ancho in anchos) + " |"
+    separador = "+" + "+".join("-" * (ancho + 2) for ancho in anchos) + "+"
     
-    avg_T = sum(tiempos_T)/len(tiempos_T) if tiempos_T else 0
-    avg_E = sum(tiempos_E)/len(tiempos_E) if tiempos_E else 0
-    avg_I = sum(indices_I)/len(indices_I) if indices_I else 0
+    # Calcular promedios excluyendo divisiones por cero
+    validos = T != 0
+    avg_T = T.mean() if T.size else 0.0
+    avg_E = E.mean() if E.size else 0.0
+    avg_I = I[validos].mean() if validos.any() else 0.0
     
     print(f"\n{'='*60}")
     print(titulo.center(60))
     print('='*60)
-    print(tabulate(
-        tabla,
-        headers=["Proceso", "ti", "t", "tf", "T", "E", "I"],
-        tablefmt="grid",
-        stralign="center",
-        numalign="center"
-    ))
+    print(separador)
+    print(formato.format(*_COLUMNAS))
+    print(separador.replace("-", "="))
+    print("\n".join(formato.format(*fila) + "\n" + separador for fila in tabla))
     print(f"\nPromedios: T={avg_T:.2f} | E={avg_E:.2f} | I={avg_I:.4f}")
     print('='*60)
 
-def fifo(procesos: List[Proceso]) -> List[Proceso]:
+def _metricas(procesos: Procesos, tf: np.ndarray) -> Resultados:
+    """Arma el arreglo de resultados calculando T, E e I a partir de tf"""
+    resultados = np.empty(procesos['ti'].size, dtype=[
+        ('id', procesos['id'].dtype),
+        ('ti', np.int64), ('t', np.int64), ('tf', np.int64),
+        ('T', np.int64), ('E', np.int64), ('I', np.float64),
+    ])
+    resultados['id'] = procesos['id']
+    resultados['ti'] = procesos['ti']
+    resultados['t'] = procesos['t']
+    resultados['tf'] = tf
+    T = resultados['T']
+    T[:] = tf - procesos['ti']                       # Tiempo de retorno (T = tf - ti)
+    resultados['E'] = T - procesos['t']              # Tiempo de espera (E = T - t)
+    resultados['I'] = 0.0                            # Índice de penalización (I = t/T)
+    np.divide(procesos['t'], T, out=resultados['I'], where=T != 0)
+    return resultados
+
+def orden_llegada(procesos: Procesos) -> np.ndarray:
+    """Índices de los procesos ordenados por (ti, posición en el archivo)"""
+    return np.argsort(procesos['ti'], kind='stable')
+
+def fifo(procesos: Procesos, orden: Optional[np.ndarray] = None) -> Resultados:
     """Algoritmo First-In First-Out (FIFO)"""
-    resultados = [Proceso(p.id, p.ti, p.t) for p in procesos]  # Copia
-    reloj = 0
-    completados = 0
+    ti, t = procesos['ti'], procesos['t']
+    if orden is None:
+        orden = orden_llegada(procesos)
+    ti_ord, t_ord = ti[orden], t[orden]
     
-    while completados < len(procesos):
-        # Buscar próximo proceso a ejecutar
-        proceso_actual = None
-        for proc in resultados:
-            if not proc.tf and proc.ti <= reloj:
-                proceso_actual = proc
-                break  # FIFO: toma el primero que encuentre
-        
-        if not proceso_actual:
-            # Avanzar reloj al próximo tiempo de llegada
-            reloj = min(p.ti for p in resultados if not p.tf)
-            continue
-        
-        # Ejecutar proceso
-        proceso_actual.tf = reloj + proceso_actual.t
-        proceso_actual.T = proceso_actual.tf - proceso_actual.ti
-        proceso_actual.E = proceso_actual.T - proceso_actual.t
-        proceso_actual.I = proceso_actual.t / proceso_actual.T if proceso_actual.T else 0
-        
-        reloj = proceso_actual.tf
-        completados += 1
+    # tf[k] = max(tf[k-1], ti[k]) + t[k], con el reloj iniciando en 0, equivale a
+    # tf[k] = max(0, max_{j<=k}(ti[j] - S[j-1])) + S[k], con S la suma acumulada de t
+    S = np.cumsum(t_ord)
+    tf_ord = np.maximum(np.maximum.accumulate(ti_ord - (S - t_ord)), 0) + S
     
-    return resultados
+    tf = np.empty_like(tf_ord)
+    tf[orden] = tf_ord
+    return _metricas(procesos, tf)
 
-def round_robin(procesos: List[Proceso], quantum: int) -> List[Proceso]:
-    """Algoritmo Round Robin con quantum especificado"""
-    resultados = [Proceso(p.id, p.ti, p.t) for p in procesos]  # Copia
-    tiempos_restantes = [p.t for p in resultados]
+@njit(cache=True)
+def _rr_nucleo(ti, orden, restantes, tf, cola, quantum: int, dinamico: bool):
+    """
+    Simulación Round Robin; escribe los tiempos de finalización en 'tf'.
+    Recibe arreglos int64 (con numba) o listas (en Python puro);
+    'restantes' se consume y 'cola' es el buffer de la cola circular.
+    Con 'dinamico', al inicio de cada ronda el quantum pasa a ser la
+    mediana de los tiempos restantes en cola (nunca menor que 'quantum').
+    """
+    n = len(ti)
+    # Cola circular: cada proceso está a lo sumo una vez en la cola
+    cabeza = 0
+    tamano = 0
     reloj = 0
     completados = 0
-    cola = []
-    indice = 0  # Para recorrer procesos
+    indice = 0          # Posición en 'orden' del próximo proceso por llegar
+    q = quantum
+    resta_ronda = 0     # Turnos que faltan para cerrar la ronda actual
     
-    while completados < len(procesos):
+    while completados < n:
         # Añadir procesos que han llegado
-        while indice < len(resultados) and resultados[indice].ti <= reloj:
-            if tiempos_restantes[indice] > 0:
-                cola.append(indice)
+        while indice < n and ti[orden[indice]] <= reloj:
+            llegado = orden[indice]
+            if restantes[llegado] > 0:
+                cola[(cabeza + tamano) % n] = llegado
+                tamano += 1
+            else:
+                tf[llegado] = reloj  # Sin ráfaga: termina en cuanto se atiende su llegada
+                completados += 1
             indice += 1
         
-        if not cola:
-            reloj += 1
+        if tamano == 0:
+            # CPU ociosa: saltar directamente a la próxima llegada
+            if indice < n:
+                reloj = ti[orden[indice]]
             continue
         
+        # Nueva ronda: con quantum dinámico se recalcula sobre la cola actual
+        if resta_ronda == 0:
+            if dinamico:
+                en_cola = np.empty(tamano, dtype=np.int64)
+                for k in range(tamano):
+                    en_cola[k] = restantes[cola[(cabeza + k) % n]]
+                q = max(quantum, int(np.median(en_cola)))
+            resta_ronda = tamano
+        resta_ronda -= 1
+        
         # Tomar próximo proceso de la cola
-        actual = cola.pop(0)
-        tiempo_ejecucion = min(quantum, tiempos_restantes[actual])
+        actual = cola[cabeza]
+        cabeza = (cabeza + 1) % n
+        tamano -= 1
+        tiempo_ejecucion = min(q, restantes[actual])
         
         # Ejecutar proceso
-        tiempos_restantes[actual] -= tiempo_ejecucion
+        restantes[actual] -= tiempo_ejecucion
         reloj += tiempo_ejecucion
         
         # Si terminó el proceso
-        if tiempos_restantes[actual] == 0:
-            resultados[actual].tf = reloj
-            resultados[actual].T = resultados[actual].tf - resultados[actual].ti
-            resultados[actual].E = resultados[actual].T - resultados[actual].t
-            resultados[actual].I = resultados[actual].t / resultados[actual].T if resultados[actual].T else 0
+        if restantes[actual] == 0:
+            tf[actual] = reloj
             completados += 1
         else:
             # Reingresar a la cola si no terminó
-            cola.append(actual)
-    
-    return resultados
+            cola[(cabeza + tamano) % n] = actual
+            tamano += 1
+
+def _round_robin(procesos: Procesos, quantum: int, orden: Optional[np.ndarray],
+                 dinamico: bool) -> Resultados:
+    """Prepara los datos para _rr_nucleo según haya o no numba"""
+    if quantum < 1:
+        # El núcleo compilado no atiende Ctrl-C: un quantum no positivo lo colgaría
+        raise ValueError(f"El quantum debe ser un entero positivo (se recibió {quantum})")
+    if orden is None:
+        orden = orden_llegada(procesos)
+    n = procesos['ti'].size
+    if HAY_NUMBA:
+        tf = np.zeros(n, dtype=np.int64)
+        _rr_nucleo(procesos['ti'], orden, procesos['t'].copy(), tf,
+                   np.empty(n, dtype=np.int64), quantum, dinamico)
+    else:
+        # En Python puro las listas se indexan más rápido que los arreglos
+        tf = [0] * n
+        _rr_nucleo(procesos['ti'].tolist(), orden.tolist(), procesos['t'].tolist(),
+                   tf, [0] * n, quantum, dinamico)
+        tf = np.array(tf, dtype=np.int64)
+    return _metricas(procesos, tf)
 
-def lifo(procesos: List[Proceso]) -> List[Proceso]:
+def round_robin(procesos: Procesos, quantum: int,
+                orden: Optional[np.ndarray] = None) -> Resultados:
+    """Algoritmo Round Robin con quantum especificado"""
+    return _round_robin(procesos, quantum, orden, dinamico=False)
+
+def round_robin_dinamico(procesos: Procesos, quantum: int,
+                         orden: Optional[np.ndarray] = None) -> Resultados:
+    """
+    Round Robin con quantum dinámico: al inicio de cada ronda el quantum
+    pasa a ser la mediana de los tiempos restantes en cola (nunca menor
+    que el quantum base), lo que reduce los cambios de contexto.
+    """
+    return _round_robin(procesos, quantum, orden, dinamico=True)
+
+def lifo(procesos: Procesos, orden: Optional[np.ndarray] = None) -> Resultados:
     """Algoritmo Last-In First-Out (LIFO)"""
-    resultados = [Proceso(p.id, p.ti, p.t) for p in procesos]  # Copia
+    ti, t = procesos['ti'], procesos['t']
+    n = ti.size
+    if orden is None:
+        orden = orden_llegada(procesos)
+    orden = orden.tolist()
+    llegadas = ti.tolist()
+    ejecuciones = t.tolist()
+    tf = np.zeros(n, dtype=np.int64)
+    # Los procesos se apilan en orden de llegada, así que el tope siempre es
+    # el último en llegar: basta una pila, sin necesidad de un heap.
+    pila = []       # Procesos que llegaron y esperan CPU
+    llegados = 0    # Cantidad de procesos ya apilados (en orden de llegada)
     reloj = 0
-    completados = 0
     
-    while completados < len(procesos):
-        # Buscar último proceso disponible
-        proceso_actual = None
-        for proc in reversed(resultados):
-            if not proc.tf and proc.ti <= reloj:
-                proceso_actual = proc
-                break  # LIFO: toma el último disponible
+    while llegados < n or pila:
+        # Apilar los procesos que han llegado
+        while llegados < n and llegadas[orden[llegados]] <= reloj:
+            pila.append(orden[llegados])
+            llegados += 1
         
-        if not proceso_actual:
+        if not pila:
             # Avanzar reloj al próximo tiempo de llegada
-            reloj = min(p.ti for p in resultados if not p.tf)
+            reloj = llegadas[orden[llegados]]
             continue
         
-        # Ejecutar proceso
-        proceso_actual.tf = reloj + proceso_actual.t
-        proceso_actual.T = proceso_actual.tf - proceso_actual.ti
-        proceso_actual.E = proceso_actual.T - proceso_actual.t
-        proceso_actual.I = proceso_actual.t / proceso_actual.T if proceso_actual.T else 0
-        
-        reloj = proceso_actual.tf
-        completados += 1
+        # LIFO: ejecuta el último en llegar
+        actual = pila.pop()
+        reloj += ejecuciones[actual]
+        tf[actual] = reloj
     
-    return resultados
+    return _metricas(procesos, tf)
 
 def main():
     print("\n" + "="*60)
@@ -218,19 +313,24 @@ def main():
     
     # Solicitar quantum para Round Robin
     quantum = int(input("\nIngrese el quantum para Round Robin (ej: 3): "))
+    if quantum < 1:
+        print(f"\nERROR: El quantum debe ser un entero positivo (se ingresó {quantum})")
+        sys.exit(1)
     
-    # Ejecutar algoritmos
-    print("\nEjecutando Round Robin...")
-    rr_resultados = round_robin(procesos, quantum)
-    mostrar_resultados("RESULTADOS ROUND ROBIN", rr_resultados)
-    
-    print("\nEjecutando FIFO...")
-    fifo_resultados = fifo(procesos)
-    mostrar_resultados("RESULTADOS FIFO", fifo_resultados)
+    # Los cuatro algoritmos recorren los procesos en orden de llegada
+    orden = orden_llegada(procesos)
     
-    print("\nEjecutando LIFO...")
-    lifo_resultados = lifo(procesos)
-    mostrar_resultados("RESULTADOS LIFO", lifo_resultados)
+    # Ejecutar algoritmos
+    algoritmos = [
+        ("RESULTADOS ROUND ROBIN", round_robin, (procesos, quantum, orden)),
+        ("RESULTADOS ROUND ROBIN (QUANTUM DINÁMICO)", round_robin_dinamico,
+         (procesos, quantum, orden)),
+        ("RESULTADOS FIFO", fifo, (procesos, orden)),
+        ("RESULTADOS LIFO", lifo, (procesos, orden)),
+    ]
+    print("\nEjecutando algoritmos...")
+    for titulo, algoritmo, argumentos in algoritmos:
+        mostrar_resultados(titulo, algoritmo(*argumentos))
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
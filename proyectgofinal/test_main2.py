@@ -0,0 +1,52 @@
+import random
+import unittest
+
+import numpy as np
+
+from main2 import fifo
+
+
+def _procesos(ti, t):
+    return {
+        'id': np.array([f"P{i}" for i in range(len(ti))]),
+        'ti': np.array(ti, dtype=np.int64),
+        't': np.array(t, dtype=np.int64),
+    }
+
+
+def _fifo_referencia(ti, t):
+    """Simulación paso a paso de FIFO por orden de llegada, reloj desde 0"""
+    tf = [0] * len(ti)
+    reloj = 0
+    for i in sorted(range(len(ti)), key=lambda i: (ti[i], i)):
+        reloj = max(reloj, ti[i]) + t[i]
+        tf[i] = reloj
+    return tf
+
+
+class TestFifo(unittest.TestCase):
+    def test_ti_negativo_respeta_reloj_inicial(self):
+        res = fifo(_procesos([-5, -1], [2, 3]))
+        self.assertEqual(res['tf'].tolist(), [2, 5])
+
+    def test_cpu_ociosa_entre_llegadas(self):
+        res = fifo(_procesos([0, 10], [2, 3]))
+        self.assertEqual(res['tf'].tolist(), [2, 13])
+        self.assertEqual(res['E'].tolist(), [0, 0])
+
+    def test_empates_respetan_orden_del_archivo(self):
+        res = fifo(_procesos([3, 3, 3], [1, 2, 3]))
+        self.assertEqual(res['tf'].tolist(), [4, 6, 9])
+
+    def test_coincide_con_simulacion_paso_a_paso(self):
+        rng = random.Random(0)
+        for _ in range(200):
+            n = rng.randint(1, 30)
+            ti = [rng.randint(-20, 60) for _ in range(n)]
+            t = [rng.randint(0, 10) for _ in range(n)]
+            res = fifo(_procesos(ti, t))
+            self.assertEqual(res['tf'].tolist(), _fifo_referencia(ti, t))
+
+
+if __name__ == "__main__":
+    unittest.main()